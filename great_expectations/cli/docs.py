@@ -1,8 +1,6 @@
-import os
 import sys
 
 import click
-import requests
 
 from great_expectations.cli import toolkit
 from great_expectations.cli.cli_logging import logger
@@ -135,12 +133,11 @@ def build_docs(context, site_name=None, view=True, assume_yes=False):
         site_names=site_names, dry_run=True
     )
 
-    msg = "\nThe following Data Docs sites will be built:\n\n"
+    msg_parts = ["\nThe following Data Docs sites will be built:\n\n"]
     for site_name, index_page_locator_info in index_page_locator_infos.items():
-        msg += " - <cyan>{}:</cyan> ".format(site_name)
-        msg += "{}\n".format(index_page_locator_info)
+        msg_parts.append(f" - <cyan>{site_name}:</cyan> {index_page_locator_info}\n")
 
-    cli_message(msg)
+    cli_message("".join(msg_parts))
     if not assume_yes:
         toolkit.confirm_proceed_or_exit()
 
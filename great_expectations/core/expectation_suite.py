@@ -196,6 +196,10 @@ class ExpectationSuite(SerializableDictDot):
         """Return a list of column map expectations."""
         return [e for e in self.expectations if "column" in e.kwargs]
 
+    def get_expectations_of_type(self, expectation_type):
+        """Return a list of expectations with the given expectation type."""
+        return [e for e in self.expectations if e.expectation_type == expectation_type]
+
     @staticmethod
     def _filter_citations(citations, filter_key):
         citations_with_bk = []
@@ -3069,6 +3069,7 @@ class DataContext(BaseDataContext):
         """Check if all config_variables.yml exists."""
         path_to_yml = os.path.join(ge_dir, cls.GE_YML)
 
+        yaml = YAML(typ="safe")
         # TODO this is so brittle and gross
         with open(path_to_yml) as f:
             config = yaml.load(f)
@@ -3267,6 +3268,7 @@ class DataContext(BaseDataContext):
         if yml_path is None:
             return
 
+        yaml = YAML(typ="safe")
         with open(yml_path) as f:
             config_dict = yaml.load(f)
 
@@ -814,15 +814,17 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
 
 def _check_that_expectations_are_available(dataset, expectations):
     if expectations:
+        available_expectations = set(dataset.list_available_expectation_types())
         for expectation in expectations:
-            if expectation not in dataset.list_available_expectation_types():
+            if expectation not in available_expectations:
                 raise ProfilerError(f"Expectation {expectation} is not available.")
 
 
 def _check_that_columns_exist(dataset, columns):
     if columns:
+        existing_columns = set(dataset.get_table_columns())
         for column in columns:
-            if column not in dataset.get_table_columns():
+            if column not in existing_columns:
                 raise ProfilerError(f"Column {column} does not exist.")
 
 
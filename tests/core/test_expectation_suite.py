@@ -424,3 +424,23 @@ def test_get_column_expectations(
 ):
     obs = suite_with_table_and_column_expectations.get_column_expectations()
     assert obs == [exp1, exp2, exp3, exp4]
+
+
+def test_get_expectations_of_type_returns_empty_list_on_empty_suite(empty_suite):
+    assert (
+        empty_suite.get_expectations_of_type("expect_column_values_to_be_in_set")
+        == []
+    )
+
+
+def test_get_expectations_of_type(
+    suite_with_table_and_column_expectations, exp1, exp2, exp3, exp4, table_exp3
+):
+    obs = suite_with_table_and_column_expectations.get_expectations_of_type(
+        "expect_column_values_to_be_in_set"
+    )
+    assert obs == [exp1, exp2, exp3, exp4]
+    obs = suite_with_table_and_column_expectations.get_expectations_of_type(
+        "expect_table_row_count_to_equal"
+    )
+    assert obs == [table_exp3]
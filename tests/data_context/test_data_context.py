@@ -18,7 +18,10 @@ from great_expectations.data_context import (
     ExplorerDataContext,
 )
 from great_expectations.data_context.store import ExpectationsStore
-from great_expectations.data_context.types.base import DataContextConfig
+from great_expectations.data_context.types.base import (
+    CURRENT_CONFIG_VERSION,
+    DataContextConfig,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
 )
@@ -1047,6 +1050,24 @@ def test_data_context_is_project_initialized_returns_false_when_config_variable_
     assert DataContext.is_project_initialized(ge_dir) == False
 
 
+def test_data_context_config_variables_yml_exist(empty_context):
+    ge_dir = empty_context.root_directory
+    assert DataContext.config_variables_yml_exist(ge_dir) == True
+
+    # mangle project
+    safe_remove(
+        os.path.join(ge_dir, empty_context.GE_UNCOMMITTED_DIR, "config_variables.yml")
+    )
+
+    assert DataContext.config_variables_yml_exist(ge_dir) == False
+
+
+def test_get_ge_config_version_reads_project_yml(empty_context):
+    ge_dir = empty_context.root_directory
+    ge_config_version = DataContext.get_ge_config_version(context_root_dir=ge_dir)
+    assert ge_config_version == float(CURRENT_CONFIG_VERSION)
+
+
 def test_data_context_create_raises_warning_and_leaves_existing_yml_untouched(
     tmp_path_factory,
 ):